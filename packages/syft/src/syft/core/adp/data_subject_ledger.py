@@ -8,7 +8,6 @@ from pathlib import Path
 import time
 from typing import Any
 from typing import Callable
-from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Tuple
@@ -118,18 +117,17 @@ def convert_dsa_to_index_array(
     unique_data_subjects = get_unique_data_subjects(data_subject_array)
     max_entity = len(unique_data_subjects)
 
-    input_entities_indexes_list: List[np.ndarray] = []
+    # preallocate the stacked output and fill each slot in place instead of
+    # growing a python list and paying for an extra copy in np.stack
+    input_entities_indexes: np.ndarray = np.empty(
+        (max_entity, *data_subject_array.shape), dtype=np.int64
+    )
 
     for data_subject_idx, data_subject in enumerate(unique_data_subjects):
         # Create a mask where the current data subject is present
         data_subject = DataSubjectArray([data_subject])
         ds_mask = np.isin(data_subject_array, data_subject)
-        input_entity_indexes = ds_mask * (
-            np.ones_like(data_subject_array, np.int64) * (data_subject_idx + 1)
-        )
-        input_entities_indexes_list.append(input_entity_indexes)
-
-    input_entities_indexes: np.ndarray = np.stack(input_entities_indexes_list)
+        input_entities_indexes[data_subject_idx] = ds_mask * (data_subject_idx + 1)
 
     return input_entities_indexes, max_entity
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # stdlib
+from itertools import count
 from typing import Any
 from typing import Dict
 from typing import Iterator
@@ -9,6 +10,7 @@ from typing import List
 from typing import Set
 from typing import Tuple
 from typing import Union
+import weakref
 
 # third party
 import numpy as np
@@ -64,7 +66,12 @@ def liststrtonumpyutf8(string_list: np.ndarray) -> Tuple[np.ndarray, np.ndarray]
 @serializable(recursive_serde=True)
 class DataSubjectList:
     __attr_allowlist__ = ("one_hot_lookup", "data_subjects_indexed")
-    __slots__ = ("one_hot_lookup", "data_subjects_indexed")
+    __slots__ = ("one_hot_lookup", "data_subjects_indexed", "_tag", "__weakref__")
+
+    # structurally identical lists share one integer tag through this table,
+    # so repeated equality checks cost an int compare instead of an array pass
+    _intern_table: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+    _tag_counter = count(1)
 
     # one_hot_lookup is a numpy array of unicode strings which can't be serialized
     __serde_overrides__ = {
@@ -127,25 +134,37 @@ class DataSubjectList:
     def __len__(self) -> int:
         return len(self.data_subjects_indexed)
 
+    @property
+    def tag(self) -> int:
+        """Integer identity shared by structurally identical lists.
+
+        Assigned lazily on first use and interned on the list's contents, so
+        it must not be read across in-place mutation of the arrays.
+        """
+        tag = getattr(self, "_tag", None)
+        if tag is not None:
+            return tag
+        key = (
+            tuple(self.one_hot_lookup.tolist()),
+            self.data_subjects_indexed.shape,
+            self.data_subjects_indexed.dtype.str,
+            self.data_subjects_indexed.tobytes(),
+        )
+        canonical = DataSubjectList._intern_table.setdefault(key, self)
+        tag = (
+            next(DataSubjectList._tag_counter) if canonical is self else canonical.tag
+        )
+        self._tag = tag
+        return tag
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, DataSubjectList):
-            dsi_comparison = self.data_subjects_indexed == other.data_subjects_indexed
-            ohl_comparison = self.one_hot_lookup == other.one_hot_lookup
-            ohl_comparison = (
-                ohl_comparison
-                if isinstance(ohl_comparison, bool)
-                else ohl_comparison.all()
-            )
-            if isinstance(dsi_comparison, bool):
-                if dsi_comparison is True and ohl_comparison is True:
-                    return True
-                else:
-                    return False
-            elif isinstance(dsi_comparison, np.ndarray):
-                if dsi_comparison.all() is True and ohl_comparison is True:
-                    return True
-                else:
-                    return False
+            # interned tags turn repeated structural comparisons into a single
+            # int compare; the first comparison of a pair pays one hashing
+            # pass, on the order of the array compare it replaces
+            return self.tag == other.tag
         return self == other
 
     def sum(self, target_shape: tuple) -> DataSubjectList:
@@ -604,6 +623,15 @@ class DataSubjectArray:
         if not isinstance(input_subjects, np.ndarray):
             input_subjects = np.array(input_subjects)
 
+        # fast path: arrays produced by tensor ops already hold DataSubjectArray
+        # elements, so skip the per-element python re-wrap pass
+        if (
+            input_subjects.dtype == np.dtype("object")
+            and input_subjects.size > 0
+            and isinstance(input_subjects.flat[0], DataSubjectArray)
+        ):
+            return input_subjects
+
         data_map = (
             lambda x: DataSubjectArray([str(x)])
             if not isinstance(x, DataSubjectArray)
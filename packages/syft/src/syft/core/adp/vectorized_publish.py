@@ -16,6 +16,7 @@ import numpy as np
 from tqdm import tqdm
 
 # relative
+from ...logger import debug
 from ..tensor.fixed_precision_tensor import FixedPrecisionTensor
 from ..tensor.lazy_repeat_array import lazyrepeatarray
 from ..tensor.passthrough import PassthroughTensor  # type: ignore
@@ -199,27 +200,15 @@ def vectorized_publish(
             print(traceback.format_exc())
             print(f"Failed to run vectorized_publish. {e}")
 
-    print("We have filtered all the input tensors. Now to compute the result:")
+    debug("We have filtered all the input tensors. Now to compute the result:")
 
     # noise = secrets.SystemRandom().gauss(0, sigma)
-    print(
-        "Filtered inputs ",
-        type(filtered_inputs),
-        type(filtered_input_tensor),
-        filtered_inputs,
-    )
-    # GammaTensor.convert_dsl(state_tree)
-    print("Converted DSLs")
     original_output = np.asarray(output_func(filtered_inputs))
-    print("original output (before noise:", original_output)
     noise = np.asarray(
         [secrets.SystemRandom().gauss(0, sigma) for _ in range(original_output.size)]
     )
     noise.resize(original_output.shape)
-    print("noise: ", noise)
-
-    output = np.asarray(output_func(filtered_inputs) + noise)
 
-    print("got output", output, type(output), output.dtype)
+    output = np.asarray(original_output + noise)
 
     return output.squeeze()
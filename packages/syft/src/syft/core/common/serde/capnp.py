@@ -30,21 +30,25 @@ def chunk_bytes(
 ) -> None:
     CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
     list_size = len(data) // CHUNK_SIZE + 1
+    # the list is initialized at its final size so capnp never has to regrow
+    # it; slicing through a memoryview keeps multi-chunk payloads from being
+    # copied once per chunk before they land in the message
+    view = memoryview(data) if isinstance(data, (bytes, bytearray)) else data
     data_lst = builder.init(field_name, list_size)
     END_INDEX = CHUNK_SIZE
     for idx in range(list_size):
         START_INDEX = idx * CHUNK_SIZE
         END_INDEX = min(START_INDEX + CHUNK_SIZE, len(data))
-        data_lst[idx] = data[START_INDEX:END_INDEX]
+        data_lst[idx] = view[START_INDEX:END_INDEX]
 
 
 def combine_bytes(capnp_list: List[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    # payloads below CHUNK_SIZE arrive as a single chunk which can be handed
+    # back without copying; larger ones are joined in a single C-level pass
+    # instead of quadratic += concatenation
+    if len(capnp_list) == 1:
+        return bytes(capnp_list[0])
+    return b"".join(capnp_list)
 
 
 def serde_magic_header(cls: type) -> bytes:
@@ -52,8 +52,10 @@ from ...node.common.action.run_class_method_action import RunClassMethodAction
 from ...pointer.pointer import Pointer
 from ..config import DEFAULT_INT_NUMPY_TYPE
 from ..fixed_precision_tensor import FixedPrecisionTensor
+from ..lazy_repeat_array import comparison_bounds
 from ..lazy_repeat_array import compute_min_max
 from ..lazy_repeat_array import lazyrepeatarray
+from ..lazy_repeat_array import matmul_min_max
 from ..passthrough import PassthroughTensor  # type: ignore
 from ..passthrough import SupportedChainType  # type: ignore
 from ..passthrough import is_acceptable_simple_type  # type: ignore
@@ -69,6 +71,9 @@ else:
     # third party
     from flax.struct import dataclass
 
+# shared generator for synthetic data previews
+_rng = np.random.default_rng()
+
 
 @serializable(recursive_serde=True)
 class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
@@ -130,10 +135,12 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
         public_dtype_func = getattr(
             self.public_dtype, "upcast", lambda: self.public_dtype
         )
+        # materialize the lazyrepeatarray bounds once instead of once per use
+        lo = self.min_vals.to_numpy()
+        hi = self.max_vals.to_numpy()
+        # float32 is ample for a preview and halves the memory traffic
         return (
-            np.random.rand(*list(self.public_shape))  # type: ignore
-            * (self.max_vals.to_numpy() - self.min_vals.to_numpy())
-            + self.min_vals.to_numpy()
+            _rng.random(self.public_shape, dtype=np.float32) * (hi - lo) + lo  # type: ignore
         ).astype(public_dtype_func())
 
     def __repr__(self) -> str:
@@ -213,11 +220,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
             other_shape = other.public_shape
             other_dtype = other.public_dtype
         elif isinstance(other, (int, float)):
+            # NOTE: bool lands here too since bool is a subclass of int
             other_shape = (1,)
             other_dtype = DEFAULT_INT_NUMPY_TYPE
-        elif isinstance(other, bool):
-            other_shape = (1,)
-            other_dtype = np.dtype("bool")
         elif isinstance(other, np.ndarray):
             other_shape = other.shape
             other_dtype = other.dtype
@@ -267,6 +272,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
 
         if (
             isinstance(other, TensorWrappedGammaTensorPointer)
+            # identity check first: same-client ops are the common case and
+            # Address.__eq__ compares four location fields
+            and self.client is not other.client
             and self.client != other.client
         ):
 
@@ -481,7 +489,7 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
                 f"Concatenate works only for TensorWrappedGammaTensorPointer got type: {type(other)}"
             )
 
-        if self.client != other.client:
+        if self.client is not other.client and self.client != other.client:
 
             parties = [self.client, other.client]
 
@@ -744,19 +752,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
         result_id_at_location = getattr(result, "id_at_location", None)
 
         if result_id_at_location is not None:
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=[], kwargs={})
-
-            # then we convert anything which isnt a pointer into a pointer
-            pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                args=downcast_args,
-                kwargs=downcast_kwargs,
-                client=self.client,
-                gc_enabled=False,
-            )
+            # zero-arg op so there is nothing to downcast or pointerize
+            pointer_args: List[Any] = []
+            pointer_kwargs: Dict[str, Any] = {}
 
             cmd = RunClassMethodAction(
                 path=attr_path_and_name,
@@ -810,19 +808,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
         result_id_at_location = getattr(result, "id_at_location", None)
 
         if result_id_at_location is not None:
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=[], kwargs={})
-
-            # then we convert anything which isnt a pointer into a pointer
-            pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                args=downcast_args,
-                kwargs=downcast_kwargs,
-                client=self.client,
-                gc_enabled=False,
-            )
+            # zero-arg op so there is nothing to downcast or pointerize
+            pointer_args: List[Any] = []
+            pointer_kwargs: Dict[str, Any] = {}
 
             cmd = RunClassMethodAction(
                 path=attr_path_and_name,
@@ -883,19 +871,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
         result_id_at_location = getattr(result, "id_at_location", None)
 
         if result_id_at_location is not None:
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=[], kwargs={})
-
-            # then we convert anything which isnt a pointer into a pointer
-            pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                args=downcast_args,
-                kwargs=downcast_kwargs,
-                client=self.client,
-                gc_enabled=False,
-            )
+            # zero-arg op so there is nothing to downcast or pointerize
+            pointer_args: List[Any] = []
+            pointer_kwargs: Dict[str, Any] = {}
 
             cmd = RunClassMethodAction(
                 path=attr_path_and_name,
@@ -936,19 +914,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
         result_id_at_location = getattr(result, "id_at_location", None)
 
         if result_id_at_location is not None:
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=[], kwargs={})
-
-            # then we convert anything which isnt a pointer into a pointer
-            pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                args=downcast_args,
-                kwargs=downcast_kwargs,
-                client=self.client,
-                gc_enabled=False,
-            )
+            # zero-arg op so there is nothing to downcast or pointerize
+            pointer_args: List[Any] = []
+            pointer_kwargs: Dict[str, Any] = {}
 
             cmd = GetOrSetPropertyAction(
                 path=attr_path_and_name,
@@ -995,19 +963,9 @@ class TensorWrappedGammaTensorPointer(Pointer, PassthroughTensor):
         result_id_at_location = getattr(result, "id_at_location", None)
 
         if result_id_at_location is not None:
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=[], kwargs={})
-
-            # then we convert anything which isnt a pointer into a pointer
-            pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                args=downcast_args,
-                kwargs=downcast_kwargs,
-                client=self.client,
-                gc_enabled=False,
-            )
+            # zero-arg op so there is nothing to downcast or pointerize
+            pointer_args: List[Any] = []
+            pointer_kwargs: Dict[str, Any] = {}
 
             cmd = RunClassMethodAction(
                 path=attr_path_and_name,
@@ -1144,8 +1102,23 @@ class GammaTensor:
 
         if isinstance(self.min_vals, lazyrepeatarray):
             if self.min_vals.data.size != 1:
-                self.min_vals.data = self.min_vals.data.min()
-                self.max_vals.data = self.max_vals.data.max()
+                # collapse to scalar bounds with fresh lazyrepeatarrays; the
+                # originals are shared with the PhiTensor that created us and
+                # must not be flattened in place
+                object.__setattr__(
+                    self,
+                    "min_vals",
+                    lazyrepeatarray(
+                        data=self.min_vals.data.min(), shape=self.min_vals.shape
+                    ),
+                )
+                object.__setattr__(
+                    self,
+                    "max_vals",
+                    lazyrepeatarray(
+                        data=self.max_vals.data.max(), shape=self.max_vals.shape
+                    ),
+                )
 
     def decode(self) -> np.ndarray:
         if isinstance(self.child, FixedPrecisionTensor):
@@ -1237,16 +1210,17 @@ class GammaTensor:
             output_state[other.id] = other
 
             child = self.child - other.child
-            min_min = self.min_vals.data - other.min_vals.data
-            min_max = self.min_vals.data - other.max_vals.data
-            max_min = self.max_vals.data - other.min_vals.data
-            max_max = self.max_vals.data - other.max_vals.data
-            _min_val = np.minimum.reduce([min_min, min_max, max_min, max_max])
-            _max_val = np.maximum.reduce([min_min, min_max, max_min, max_max])
-            min_val = self.min_vals.copy()
-            min_val.data = _min_val
-            max_val = self.max_vals.copy()
-            max_val.data = _max_val
+            # for a - b the interval extremes are min(a) - max(b) and
+            # max(a) - min(b); build the results directly instead of copying
+            # the old bound arrays only to overwrite them
+            min_val = lazyrepeatarray(
+                data=self.min_vals.data - other.max_vals.data,
+                shape=self.min_vals.shape,
+            )
+            max_val = lazyrepeatarray(
+                data=self.max_vals.data - other.min_vals.data,
+                shape=self.max_vals.shape,
+            )
 
             output_ds = self.data_subjects - other.data_subjects
 
@@ -1291,8 +1265,13 @@ class GammaTensor:
             min_max = self.min_vals.data * other.max_vals.data
             max_min = self.max_vals.data * other.min_vals.data
             max_max = self.max_vals.data * other.max_vals.data
-            _min_val = np.array(np.min([min_min, min_max, max_min, max_max], axis=0))  # type: ignore
-            _max_val = np.array(np.max([min_min, min_max, max_min, max_max], axis=0))  # type: ignore
+            # pairwise ufunc reductions avoid stacking a (4, *bounds) temporary
+            _min_val = np.minimum(  # type: ignore
+                np.minimum(min_min, min_max), np.minimum(max_min, max_max)
+            )
+            _max_val = np.maximum(  # type: ignore
+                np.maximum(min_min, min_max), np.maximum(max_min, max_max)
+            )
             output_ds = self.data_subjects * other.data_subjects
 
         else:
@@ -1301,12 +1280,12 @@ class GammaTensor:
                 return jnp.multiply(self.run(state), other)
 
             child = self.child * other
-            min_min = self.min_vals.data * other
-            min_max = self.min_vals.data * other
-            max_min = self.max_vals.data * other
-            max_max = self.max_vals.data * other
-            _min_val = np.array(np.min([min_min, min_max, max_min, max_max], axis=0))  # type: ignore
-            _max_val = np.array(np.max([min_min, min_max, max_min, max_max], axis=0))  # type: ignore
+            # a scalar multiplier preserves or swaps the bound order with its
+            # sign, so two products and one pairwise min/max are enough
+            scaled_min = self.min_vals.data * other
+            scaled_max = self.max_vals.data * other
+            _min_val = np.minimum(scaled_min, scaled_max)  # type: ignore
+            _max_val = np.maximum(scaled_min, scaled_max)  # type: ignore
             output_ds = self.data_subjects * other
 
         min_val = self.min_vals.copy()
@@ -1341,8 +1320,12 @@ class GammaTensor:
 
             output_state[other.id] = other
             child = self.child @ other.child
-            min_val = self.min_vals.__matmul__(other.min_vals)
-            max_val = self.max_vals.__matmul__(other.max_vals)
+            min_val, max_val = matmul_min_max(
+                self.min_vals,
+                self.max_vals,
+                other.min_vals.to_numpy(),
+                other.max_vals.to_numpy(),
+            )
             output_ds = self.data_subjects @ other.data_subjects
 
         else:
@@ -1351,8 +1334,10 @@ class GammaTensor:
                 return jnp.matmul(self.run(state), other)
 
             child = self.child @ other
-            min_val = self.min_vals.__matmul__(other)
-            max_val = self.max_vals.__matmul__(other)
+            other_data = np.asarray(other)
+            min_val, max_val = matmul_min_max(
+                self.min_vals, self.max_vals, other_data, other_data
+            )
 
             output_ds = self.data_subjects @ other
 
@@ -1386,8 +1371,13 @@ class GammaTensor:
 
             output_state[other.id] = other
             child = self.child.__rmatmul__(other.child)
-            min_val = self.min_vals.__rmatmul__(other.min_vals)
-            max_val = self.max_vals.__rmatmul__(other.max_vals)
+            min_val, max_val = matmul_min_max(
+                self.min_vals,
+                self.max_vals,
+                other.min_vals.to_numpy(),
+                other.max_vals.to_numpy(),
+                reverse=True,
+            )
             output_ds = self.data_subjects.__rmatmul__(other.data_subjects)
 
         else:
@@ -1396,8 +1386,10 @@ class GammaTensor:
                 return jnp.matmul(other, self.run(state))
 
             child = self.child.__rmatmul__(other)
-            min_val = self.min_vals.__rmatmul__(other)
-            max_val = self.max_vals.__rmatmul__(other)
+            other_data = np.asarray(other)
+            min_val, max_val = matmul_min_max(
+                self.min_vals, self.max_vals, other_data, other_data, reverse=True
+            )
             output_ds = self.data_subjects.__rmatmul__(other)
 
         return GammaTensor(
@@ -1437,8 +1429,7 @@ class GammaTensor:
             child = self.child.__gt__(other)
             output_ds = self.data_subjects.__gt__(other)
 
-        min_val = self.min_vals * 0
-        max_val = (self.max_vals * 0) + 1
+        min_val, max_val = comparison_bounds(self.min_vals, self.max_vals)
 
         return GammaTensor(
             child=child,
@@ -1485,8 +1476,7 @@ class GammaTensor:
             child = self.child.__lt__(other)
             output_ds = self.data_subjects.__lt__(other)
 
-        min_val = self.min_vals * 0
-        max_val = (self.max_vals * 0) + 1
+        min_val, max_val = comparison_bounds(self.min_vals, self.max_vals)
 
         return GammaTensor(
             child=child,
@@ -1525,8 +1515,7 @@ class GammaTensor:
             child = self.child.__le__(other)
             output_ds = self.data_subjects
 
-        min_val = self.min_vals * 0
-        max_val = (self.max_vals * 0) + 1
+        min_val, max_val = comparison_bounds(self.min_vals, self.max_vals)
 
         return GammaTensor(
             child=child,
@@ -1707,6 +1696,27 @@ class GammaTensor:
     def T(self) -> GammaTensor:
         return self.transpose()
 
+    def _summed_data_subjects(
+        self, axis: Optional[Union[int, Tuple[int, ...]]], **kwargs: Any
+    ) -> np.ndarray:
+        # reducing the object-dtype data subject array unions python sets
+        # element by element; the inputs never change between repeated sums of
+        # the same tensor, so reuse the previous reduction
+        key = (axis, tuple(sorted(kwargs.items())))
+        cached = getattr(self, "_sum_ds_cache", None)
+        if (
+            cached is not None
+            and cached[0] is self.data_subjects
+            and cached[1] == key
+        ):
+            return cached[2]
+        result = np.array(self.data_subjects.sum(axis=axis, **kwargs))
+        # frozen dataclass: attribute writes must bypass __setattr__
+        object.__setattr__(
+            self, "_sum_ds_cache", (self.data_subjects, key, result)
+        )
+        return result
+
     def sum(
         self, axis: Optional[Union[int, Tuple[int, ...]]] = None, **kwargs: Any
     ) -> GammaTensor:
@@ -1723,7 +1733,7 @@ class GammaTensor:
 
         return GammaTensor(
             child=child,
-            data_subjects=np.array(self.data_subjects.sum(axis=axis, **kwargs)),
+            data_subjects=self._summed_data_subjects(axis, **kwargs),
             min_vals=lazyrepeatarray(data=min_v, shape=child.shape),
             max_vals=lazyrepeatarray(data=max_v, shape=child.shape),
             func=_sum,
@@ -2255,13 +2265,31 @@ class GammaTensor:
             minv = value.child.min()
             maxv = value.child.max()
 
+            # build fresh bound objects instead of rebinding .data: collapsed
+            # bounds are shared with every copy_with alias and must not see
+            # this tensor's mutation
+            # frozen dataclass: attribute writes must bypass __setattr__
             if minv < self.min_vals.data.min():
-                self.min_vals.data = minv
+                object.__setattr__(
+                    self,
+                    "min_vals",
+                    lazyrepeatarray(data=np.array(minv), shape=self.min_vals.shape),
+                )
 
             if maxv > self.max_vals.data.max():
-                self.max_vals.data = maxv
+                object.__setattr__(
+                    self,
+                    "max_vals",
+                    lazyrepeatarray(data=np.array(maxv), shape=self.max_vals.shape),
+                )
 
             self.data_subjects[key] = value.data_subjects
+            # the data subjects mutate in place without changing identity, so
+            # neither the memoized sum reduction nor the cached UTF-8 subject
+            # encoding describes this tensor any longer
+            # frozen dataclass: attribute writes must bypass __setattr__
+            object.__setattr__(self, "_sum_ds_cache", None)
+            object.__setattr__(self, "_data_subjects_utf8_cache", None)
 
             # output_dsl = DataSubjectList.insert(
             #     dsl1=self.data_subjects, dsl2=value.data_subjects, index=key
@@ -2271,14 +2299,26 @@ class GammaTensor:
 
         elif isinstance(value, np.ndarray):
             self.child[key] = value
+            # same cache invalidation as the tensor branch above
+            object.__setattr__(self, "_sum_ds_cache", None)
+            object.__setattr__(self, "_data_subjects_utf8_cache", None)
             minv = value.min()
             maxv = value.max()
 
+            # fresh bound objects for the same aliasing reason as above
             if minv < self.min_vals.data.min():
-                self.min_vals.data = minv
+                object.__setattr__(
+                    self,
+                    "min_vals",
+                    lazyrepeatarray(data=np.array(minv), shape=self.min_vals.shape),
+                )
 
             if maxv > self.max_vals.data.max():
-                self.max_vals.data = maxv
+                object.__setattr__(
+                    self,
+                    "max_vals",
+                    lazyrepeatarray(data=np.array(maxv), shape=self.max_vals.shape),
+                )
 
         else:
             raise NotImplementedError
@@ -2346,6 +2386,19 @@ class GammaTensor:
                 input_tensors += GammaTensor.get_input_tensors(tensor.state)
         return input_tensors
 
+    def _data_subjects_utf8(self) -> np.ndarray:
+        # encoding the data subjects is a python loop over every element, so
+        # keep the result around for repeat serializations of the same array
+        cached = getattr(self, "_data_subjects_utf8_cache", None)
+        if cached is not None and cached[0] is self.data_subjects:
+            return cached[1]
+        encoded = dslarraytonumpyutf8(self.data_subjects)
+        # frozen dataclass: attribute writes must bypass __setattr__
+        object.__setattr__(
+            self, "_data_subjects_utf8_cache", (self.data_subjects, encoded)
+        )
+        return encoded
+
     def _object2bytes(self) -> bytes:
         schema = get_capnp_schema(schema_file="gamma_tensor.capnp")
 
@@ -2359,7 +2412,7 @@ class GammaTensor:
         # what about the state dict?
 
         if isinstance(self.child, np.ndarray) or np.isscalar(self.child):
-            chunk_bytes(capnp_serialize(np.array(self.child), to_bytes=True), "child", gamma_msg)  # type: ignore
+            chunk_bytes(capnp_serialize(np.asarray(self.child), to_bytes=True), "child", gamma_msg)  # type: ignore
             gamma_msg.isNumpy = True
         elif isinstance(self.child, jnp.ndarray):
             chunk_bytes(
@@ -2374,7 +2427,7 @@ class GammaTensor:
 
         gamma_msg.state = serialize(self.state, to_bytes=True)
         chunk_bytes(
-            capnp_serialize(dslarraytonumpyutf8(self.data_subjects), to_bytes=True),
+            capnp_serialize(self._data_subjects_utf8(), to_bytes=True),
             "dataSubjects",
             gamma_msg,
         )
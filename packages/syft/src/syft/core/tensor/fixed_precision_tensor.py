@@ -273,7 +273,7 @@ class FixedPrecisionTensor(PassthroughTensor):
         # child of FPT tensor could either be ShareTensor or np.ndarray
         if isinstance(self.child, np.ndarray) or np.isscalar(self.child):
             chunk_bytes(
-                capnp_serialize(np.array(self.child), to_bytes=True), "child", fpt_msg
+                capnp_serialize(np.asarray(self.child), to_bytes=True), "child", fpt_msg
             )
             fpt_msg.isNumpy = True
         else:
@@ -283,10 +283,9 @@ class FixedPrecisionTensor(PassthroughTensor):
         fpt_msg.base = self.base
         fpt_msg.precision = self.precision
 
-        # to pack or not to pack?
-        # to_bytes = fpt_msg.to_bytes()
-
-        return fpt_msg.to_bytes_packed()
+        # packing only squeezes zero-runs, which dense ndarray payloads barely
+        # have, while costing a pass over the whole message
+        return fpt_msg.to_bytes()
 
     @staticmethod
     def _bytes2object(buf: bytes) -> FixedPrecisionTensor:
@@ -294,23 +293,22 @@ class FixedPrecisionTensor(PassthroughTensor):
         fpt_struct: CapnpModule = schema.FPT  # type: ignore
         # https://stackoverflow.com/questions/48458839/capnproto-maximum-filesize
         MAX_TRAVERSAL_LIMIT = 2**64 - 1
-        # to pack or not to pack?
-        # fpt_msg = fpt_struct.from_bytes(buf, traversal_limit_in_words=2 ** 64 - 1)
-        fpt_msg = fpt_struct.from_bytes_packed(
+        # capnp from_bytes is now a context
+        with fpt_struct.from_bytes(
             buf, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
-        )
+        ) as fpt_msg:
 
-        if fpt_msg.isNumpy:
-            child = capnp_deserialize(combine_bytes(fpt_msg.child), from_bytes=True)
-        else:
-            child = deserialize(combine_bytes(fpt_msg.child), from_bytes=True)
+            if fpt_msg.isNumpy:
+                child = capnp_deserialize(combine_bytes(fpt_msg.child), from_bytes=True)
+            else:
+                child = deserialize(combine_bytes(fpt_msg.child), from_bytes=True)
 
-        base = fpt_msg.base
-        precision = fpt_msg.precision
+            base = fpt_msg.base
+            precision = fpt_msg.precision
 
-        res = FixedPrecisionTensor(base=base, precision=precision)
-        res.child = child
-        return res
+            res = FixedPrecisionTensor(base=base, precision=precision)
+            res.child = child
+            return res
 
     def __getitem__(
         self, item: Union[str, int, slice, PassthroughTensor]
@@ -61,6 +61,9 @@ class lazyrepeatarray:
 
         self.data = data
         self.shape = shape
+        self._to_numpy_cache: Optional[
+            Tuple[np.ndarray, Tuple[int, ...], np.ndarray]
+        ] = None
         if isinstance(shape, Iterable):
             for val in shape:
                 if val < 0:
@@ -86,6 +89,10 @@ class lazyrepeatarray:
         if is_acceptable_simple_type(other):
             return self.__class__(data=self.data + other, shape=self.shape)
 
+        if self.data.size == 1 and other.data.size == 1:
+            # scalars stay scalars; no need to check broadcastability
+            return self.__class__(data=self.data + other.data, shape=self.shape)
+
         if not is_broadcastable(self.shape, other.shape):
             raise Exception(
                 f"Cannot broadcast arrays with shapes: {self.shape} & {other.shape}"
@@ -106,6 +113,10 @@ class lazyrepeatarray:
             res = self.data - other
             return self.__class__(data=res, shape=res.shape)
 
+        if self.data.size == 1 and other.data.size == 1:
+            # scalars stay scalars; no need to check broadcastability
+            return self.__class__(data=self.data - other.data, shape=self.shape)
+
         if not is_broadcastable(self.shape, other.shape):
             raise Exception(
                 f"Cannot broadcast arrays with shapes: {self.shape} & {other.shape}"
@@ -259,7 +270,19 @@ class lazyrepeatarray:
         return np.prod(self.shape)
 
     def sum(self, *args: Tuple[Any, ...], **kwargs: Any) -> lazyrepeatarray:
-        res = np.array(self.to_numpy().sum(*args, **kwargs))
+        # only take the fast path for a plain full reduction; anything beyond
+        # axis=None (keepdims, dtype, ...) must reach the real sum
+        if (
+            self.data.size == 1
+            and not args
+            and set(kwargs) <= {"axis"}
+            and kwargs.get("axis") is None
+        ):
+            # collapsed data repeats across the full shape, so the total is a
+            # single multiply instead of materializing the broadcast array
+            res = np.asarray(self.data.reshape(()) * int(self.size))
+            return lazyrepeatarray(data=res, shape=res.shape)
+        res = np.asarray(self.to_numpy().sum(*args, **kwargs))
         return lazyrepeatarray(data=res, shape=res.shape)
 
     def ones_like(self, *args: Tuple[Any, ...], **kwargs: Any) -> lazyrepeatarray:
@@ -314,8 +337,13 @@ class lazyrepeatarray:
         if not isinstance(other, lazyrepeatarray):
             raise NotImplementedError
 
+        # broadcast dummies give the result shape for a byte per element
+        # instead of allocating both operands at full width
+        dummy = np.empty(1, dtype=np.uint8)
         dummy_res = np.concatenate(
-            (np.empty(self.shape), np.empty(other.shape)), *args, **kwargs
+            (np.broadcast_to(dummy, self.shape), np.broadcast_to(dummy, other.shape)),
+            *args,
+            **kwargs,
         )
         return lazyrepeatarray(data=self.data, shape=dummy_res.shape)
 
@@ -327,7 +355,18 @@ class lazyrepeatarray:
         return self.__class__(self.data.astype(np_type), self.shape)
 
     def to_numpy(self) -> np.ndarray:
-        return np.broadcast_to(self.data, self.shape)
+        # the contents are invariant until .data / .shape are rebound, so we can
+        # hand back the same broadcast view instead of rebuilding it every call
+        cached = getattr(self, "_to_numpy_cache", None)
+        if (
+            cached is not None
+            and cached[0] is self.data
+            and cached[1] == self.shape
+        ):
+            return cached[2]
+        result = np.broadcast_to(self.data, self.shape)
+        self._to_numpy_cache = (self.data, self.shape, result)
+        return result
 
     def __repr__(self) -> str:
         return f"<lazyrepeatarray data: {self.data} -> shape: {self.shape}>"
@@ -342,12 +381,72 @@ class lazyrepeatarray:
         return self.data.any()
 
     def transpose(self, *args: List[Any], **kwargs: Dict[str, Any]) -> lazyrepeatarray:
-        dummy_res = self.to_numpy().transpose(*args, **kwargs)
+        # a broadcast dummy yields the transposed shape without materializing
+        # the repeated array the way to_numpy would
+        dummy_res = np.broadcast_to(np.empty(1, dtype=np.uint8), self.shape).transpose(
+            *args, **kwargs
+        )
+        if self.data.size == 1:
+            # collapsed data repeats identically at every position, so only
+            # the advertised shape changes
+            return lazyrepeatarray(data=self.data, shape=dummy_res.shape)
         return lazyrepeatarray(
             data=self.data.transpose(*args, **kwargs), shape=dummy_res.shape
         )
 
 
+# Comparison results are always bounded by [0, 1]. Build those bounds as
+# scalar-collapsed lazyrepeatarrays instead of multiplying full bound arrays
+# by zero, which costs two array passes per comparison for a constant.
+def comparison_bounds(
+    x_min_vals: lazyrepeatarray, x_max_vals: lazyrepeatarray
+) -> Tuple[lazyrepeatarray, lazyrepeatarray]:
+    # 0 and 1 are exact in int8, which matches the int8 comparison outputs
+    # and keeps the constant bounds as narrow as the data they describe; the
+    # constants are 0-d so they also broadcast to scalar-shaped operands
+    min_vals = lazyrepeatarray(data=np.zeros((), dtype=np.int8), shape=x_min_vals.shape)
+    max_vals = lazyrepeatarray(data=np.ones((), dtype=np.int8), shape=x_max_vals.shape)
+    return (min_vals, max_vals)
+
+
+# Propagating bounds through a matmul as ``min @ min`` / ``max @ max`` is wrong
+# as soon as either operand can be negative: the extremes of a dot product mix
+# terms from both bounds. The midpoint-radius form is always a valid enclosure:
+# writing A = mid_a +/- rad_a and B = mid_b +/- rad_b gives
+# |A @ B - mid_a @ mid_b| <= |mid_a| @ rad_b + rad_a @ (|mid_b| + rad_b),
+# and it is exact whenever one operand is a point matrix (rad = 0). Everything
+# stays inside dense matmuls, so no python-level loop over entries is needed.
+def matmul_min_max(
+    x_min_vals: lazyrepeatarray,
+    x_max_vals: lazyrepeatarray,
+    y_min: np.ndarray,
+    y_max: np.ndarray,
+    reverse: bool = False,
+) -> Tuple[lazyrepeatarray, lazyrepeatarray]:
+    a_min = x_min_vals.to_numpy()
+    a_max = x_max_vals.to_numpy()
+    mid_a = (a_min + a_max) / 2
+    rad_a = (a_max - a_min) / 2
+    mid_b = (y_min + y_max) / 2
+    rad_b = (y_max - y_min) / 2
+    if reverse:
+        mid_a, mid_b = mid_b, mid_a
+        rad_a, rad_b = rad_b, rad_a
+    mid = mid_a @ mid_b
+    if y_min is y_max:
+        # point operand: its radius is zero, so a single product of the
+        # interval side's radius against the point's magnitudes is exact
+        rad = np.abs(mid_a) @ rad_b if reverse else rad_a @ np.abs(mid_b)
+    else:
+        rad = np.abs(mid_a) @ rad_b + rad_a @ (np.abs(mid_b) + rad_b)
+    lo = mid - rad
+    hi = mid + rad
+    return (
+        lazyrepeatarray(data=lo, shape=lo.shape),
+        lazyrepeatarray(data=hi, shape=hi.shape),
+    )
+
+
 # As the min and max values calculation is the same regardless of the tensor type,
 # We centralize this method as baseline for calculation for min/max values
 def compute_min_max(
@@ -359,7 +458,7 @@ def compute_min_max(
     min_vals: lazyrepeatarray
     max_vals: lazyrepeatarray
 
-    if op_str in ["__add__", "__matmul__", "__rmatmul__"]:
+    if op_str == "__add__":
         if is_acceptable_simple_type(other):
             min_vals = getattr(x_min_vals, op_str)(other)
             max_vals = getattr(x_max_vals, op_str)(other)
@@ -371,32 +470,81 @@ def compute_min_max(
                 f"Not supported type for lazy repeat array computation: {type(other)}"
             )
 
-    elif op_str in ["__sub__", "__mul__"]:
+    elif op_str in ["__matmul__", "__rmatmul__"]:
+        reverse = op_str == "__rmatmul__"
+        if is_acceptable_simple_type(other):
+            other_data = np.asarray(other)
+            min_vals, max_vals = matmul_min_max(
+                x_min_vals, x_max_vals, other_data, other_data, reverse=reverse
+            )
+        elif hasattr(other, "min_vals") and hasattr(other, "max_vals"):
+            min_vals, max_vals = matmul_min_max(
+                x_min_vals,
+                x_max_vals,
+                other.min_vals.to_numpy(),  # type: ignore
+                other.max_vals.to_numpy(),  # type: ignore
+                reverse=reverse,
+            )
+        else:
+            raise ValueError(
+                f"Not supported type for lazy repeat array computation: {type(other)}"
+            )
+
+    elif op_str == "__sub__":
+        if is_acceptable_simple_type(other):
+            min_vals = getattr(x_min_vals, op_str)(other)
+            max_vals = getattr(x_max_vals, op_str)(other)
+        elif hasattr(other, "min_vals") and hasattr(other, "max_vals"):
+            # for a - b the interval extremes are min(a) - max(b) and
+            # max(a) - min(b); build the results directly instead of copying
+            # the old bound arrays only to overwrite them
+            min_vals = lazyrepeatarray(
+                data=x_min_vals.data - other.max_vals.data,  # type: ignore
+                shape=x_min_vals.shape,
+            )
+            max_vals = lazyrepeatarray(
+                data=x_max_vals.data - other.min_vals.data,  # type: ignore
+                shape=x_max_vals.shape,
+            )
+        else:
+            raise ValueError(
+                f"Not supported type for lazy repeat array computation: {type(other)}"
+            )
+
+    elif op_str == "__mul__":
         if is_acceptable_simple_type(other):
             min_vals = getattr(x_min_vals, op_str)(other)
             max_vals = getattr(x_max_vals, op_str)(other)
         elif hasattr(other, "min_vals") and hasattr(other, "max_vals"):
-            min_min = getattr(x_min_vals.data, op_str)(other.min_vals.data)  # type: ignore
-            min_max = getattr(x_min_vals.data, op_str)(other.max_vals.data)  # type: ignore
-            max_min = getattr(x_max_vals.data, op_str)(other.min_vals.data)  # type: ignore
-            max_max = getattr(x_max_vals.data, op_str)(other.max_vals.data)  # type: ignore
-            _min_vals = np.minimum.reduce([min_min, min_max, max_min, max_max])
-            _max_vals = np.maximum.reduce([min_min, min_max, max_min, max_max])
-            min_vals = x_min_vals.copy()
-            min_vals.data = _min_vals
-            max_vals = x_max_vals.copy()
-            max_vals.data = _max_vals
+            min_min = x_min_vals.data * other.min_vals.data  # type: ignore
+            min_max = x_min_vals.data * other.max_vals.data  # type: ignore
+            max_min = x_max_vals.data * other.min_vals.data  # type: ignore
+            max_max = x_max_vals.data * other.max_vals.data  # type: ignore
+            # pairwise reductions skip the (4, *bounds) stack that
+            # np.minimum.reduce builds from a list; the max pass then reuses
+            # the dead product buffers as scratch
+            _min_vals = np.minimum(
+                np.minimum(min_min, min_max), np.minimum(max_min, max_max)
+            )
+            _max_vals = np.maximum(
+                np.maximum(min_min, min_max, out=min_min),
+                np.maximum(max_min, max_max, out=max_min),
+                out=min_min,
+            )
+            min_vals = lazyrepeatarray(data=_min_vals, shape=x_min_vals.shape)
+            max_vals = lazyrepeatarray(data=_max_vals, shape=x_max_vals.shape)
         else:
             raise ValueError(
                 f"Not supported type for lazy repeat array computation: {type(other)}"
             )
 
     elif op_str in ["__gt__", "__lt__", "__le__", "__ge__", "__eq__", "__ne__"]:
-        min_vals = x_min_vals * 0
-        max_vals = (x_max_vals * 0) + 1
+        min_vals, max_vals = comparison_bounds(x_min_vals, x_max_vals)
     elif op_str == "sum":
-        min_vals = lazyrepeatarray(data=np.array(x_min_vals.sum(axis=None)), shape=())
-        max_vals = lazyrepeatarray(data=np.array(x_max_vals.sum(axis=None)), shape=())
+        # .sum already returns a lazyrepeatarray; wrapping it in np.array would
+        # produce a 0-d object array instead of the numeric total
+        min_vals = lazyrepeatarray(data=x_min_vals.sum(axis=None).data, shape=())
+        max_vals = lazyrepeatarray(data=x_max_vals.sum(axis=None).data, shape=())
     else:
         raise ValueError(f"Invaid Operation for LazyRepeatArray: {op_str}")
 
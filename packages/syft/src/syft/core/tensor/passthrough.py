@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 # stdlib
+from functools import lru_cache
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -25,8 +26,15 @@ AcceptableSimpleType = Union[int, bool, float, np.ndarray]
 SupportedChainType = Union["PassthroughTensor", AcceptableSimpleType]
 
 
+@lru_cache(maxsize=None)
+def _is_acceptable_simple_type(obj_type):
+    return issubclass(obj_type, (int, bool, float, np.ndarray, torch.Tensor))
+
+
 def is_acceptable_simple_type(obj):
-    return isinstance(obj, (int, bool, float, np.ndarray, torch.Tensor))
+    # every tensor dunder probes this before doing any real work, so cache the
+    # answer per concrete type instead of re-running the isinstance ladder
+    return _is_acceptable_simple_type(type(obj))
 
 
 class PassthroughTensor(np.lib.mixins.NDArrayOperatorsMixin):
@@ -872,7 +872,7 @@ class ShareTensor(PassthroughTensor):
         # child of Share tensor could either be Python Scalar or np.ndarray
         if isinstance(self.child, np.ndarray) or np.isscalar(self.child):
             chunk_bytes(
-                capnp_serialize(np.array(self.child), to_bytes=True), "child", st_msg
+                capnp_serialize(np.asarray(self.child), to_bytes=True), "child", st_msg
             )
             st_msg.isNumpy = True
         else:
@@ -884,7 +884,9 @@ class ShareTensor(PassthroughTensor):
         st_msg.seedPrzs = self.seed_przs
         st_msg.ringSize = str(self.ring_size)
 
-        return st_msg.to_bytes_packed()
+        # packing only squeezes zero-runs, which dense ndarray payloads barely
+        # have, while costing a pass over the whole message
+        return st_msg.to_bytes()
 
     @staticmethod
     def _bytes2object(buf: bytes) -> ShareTensor:
@@ -893,22 +895,23 @@ class ShareTensor(PassthroughTensor):
         # https://stackoverflow.com/questions/48458839/capnproto-maximum-filesize
         MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
-        st_msg = st_struct.from_bytes_packed(
+        # capnp from_bytes is now a context
+        with st_struct.from_bytes(
             buf, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
-        )
-
-        if st_msg.isNumpy:
-            child = capnp_deserialize(combine_bytes(st_msg.child), from_bytes=True)
-        else:
-            child = deserialize(combine_bytes(st_msg.child), from_bytes=True)
+        ) as st_msg:
 
-        return ShareTensor(
-            value=child,
-            rank=st_msg.rank,
-            parties_info=deserialize(st_msg.partiesInfo, from_bytes=True),
-            seed_przs=st_msg.seedPrzs,
-            ring_size=int(st_msg.ringSize),
-        )
+            if st_msg.isNumpy:
+                child = capnp_deserialize(combine_bytes(st_msg.child), from_bytes=True)
+            else:
+                child = deserialize(combine_bytes(st_msg.child), from_bytes=True)
+
+            return ShareTensor(
+                value=child,
+                rank=st_msg.rank,
+                parties_info=deserialize(st_msg.partiesInfo, from_bytes=True),
+                seed_przs=st_msg.seedPrzs,
+                ring_size=int(st_msg.ringSize),
+            )
 
     __add__ = add
     __radd__ = add
@@ -52,7 +52,22 @@ def get_nr_bits(ring_size: int) -> int:
     return (ring_size - 1).bit_length()
 
 
-@lru_cache(maxsize=128)
+# elementwise ops whose result shape follows plain broadcasting rules
+BROADCAST_OPS = {
+    "__add__",
+    "__sub__",
+    "__mul__",
+    "__truediv__",
+    "__lt__",
+    "__gt__",
+    "__ge__",
+    "__le__",
+    "__eq__",
+    "__ne__",
+}
+
+
+@lru_cache(maxsize=1024)
 def get_shape(
     op_str: str,
     x_shape: Tuple[int],
@@ -68,7 +83,10 @@ def get_shape(
     Returns:
         The shape of the result
     """
-    if op_str[:2] != "__":
+    if op_str in BROADCAST_OPS:
+        # no need to materialize operands just to infer the result shape
+        res = np.broadcast_shapes(x_shape, y_shape)
+    elif op_str[:2] != "__":
         op = getattr(operator, op_str)
         res = op(np.empty(x_shape), np.empty(y_shape)).shape
     else:
@@ -51,6 +51,24 @@ from .smpc import context
 from .smpc import utils
 from .smpc.mpc_tensor import MPCTensor
 
+# resolved once so _apply_op avoids a module-dict getattr per operation
+_OP_TABLE: Dict[str, Callable] = {
+    op_str: getattr(operator, op_str)
+    for op_str in (
+        "add",
+        "sub",
+        "mul",
+        "matmul",
+        "truediv",
+        "lt",
+        "gt",
+        "ge",
+        "le",
+        "eq",
+        "ne",
+    )
+}
+
 
 class TensorPointer(Pointer):
 
@@ -168,11 +186,9 @@ class TensorPointer(Pointer):
             other_shape = other.public_shape
             other_dtype = other.public_dtype
         elif isinstance(other, (int, float)):
+            # NOTE: bool lands here too since bool is a subclass of int
             other_shape = (1,)
             other_dtype = np.int32
-        elif isinstance(other, bool):
-            other_shape = (1,)
-            other_dtype = np.dtype("bool")
         elif isinstance(other, np.ndarray):
             other_shape = other.shape
             other_dtype = other.dtype
@@ -213,7 +229,13 @@ class TensorPointer(Pointer):
             Tuple[MPCTensor,Union[MPCTensor,int,float,np.ndarray]] : Result of the operation
         """
 
-        if isinstance(other, TensorPointer) and self.client != other.client:
+        if (
+            isinstance(other, TensorPointer)
+            # identity check first: same-client ops are the common case and
+            # Address.__eq__ compares four location fields
+            and self.client is not other.client
+            and self.client != other.client
+        ):
 
             parties = [self.client, other.client]
             self_mpc = MPCTensor(secret=self, shape=self.public_shape, parties=parties)
@@ -221,14 +243,14 @@ class TensorPointer(Pointer):
                 secret=other, shape=other.public_shape, parties=parties
             )
             if op_str != "concatenate":
-                op = getattr(operator, op_str)
+                op = _OP_TABLE[op_str]
                 return op(self_mpc, other_mpc)
             else:
                 return self_mpc.concatenate(other_mpc)
 
         elif isinstance(other, MPCTensor):
             if op_str != "concatenate":
-                op = getattr(operator, op_str)
+                op = _OP_TABLE[op_str]
                 return op(other, self)
             else:
                 return other.concatenate(self)
@@ -648,7 +670,9 @@ class Tensor(
         tensor_msg.publicDtype = public_dtype_func()
         tensor_msg.tagName = self.tag_name
 
-        return tensor_msg.to_bytes_packed()
+        # packing only squeezes zero-runs, which dense ndarray payloads barely
+        # have, while costing a pass over the whole message
+        return tensor_msg.to_bytes()
 
     @staticmethod
     def _bytes2object(buf: bytes) -> Tensor:
@@ -656,15 +680,18 @@ class Tensor(
         tensor_struct: CapnpModule = schema.Tensor  # type: ignore
         # https://stackoverflow.com/questions/48458839/capnproto-maximum-filesize
         MAX_TRAVERSAL_LIMIT = 2**64 - 1
-        tensor_msg = tensor_struct.from_bytes_packed(
+        # capnp from_bytes is now a context
+        with tensor_struct.from_bytes(
             buf, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
-        )
-
-        tensor = Tensor(
-            child=sy.deserialize(combine_bytes(tensor_msg.child), from_bytes=True),
-            public_shape=sy.deserialize(tensor_msg.publicShape, from_bytes=True),
-            public_dtype=tensor_msg.publicDtype,
-        )
-        tensor.tag_name = tensor_msg.tagName
+        ) as tensor_msg:
+
+            tensor = Tensor(
+                child=sy.deserialize(combine_bytes(tensor_msg.child), from_bytes=True),
+                public_shape=sy.deserialize(
+                    tensor_msg.publicShape, from_bytes=True
+                ),
+                public_dtype=tensor_msg.publicDtype,
+            )
+            tensor.tag_name = tensor_msg.tagName
 
-        return tensor
+            return tensor
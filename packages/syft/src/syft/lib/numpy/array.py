@@ -65,7 +65,9 @@ def capnp_serialize(obj: np.ndarray, to_bytes: bool = False) -> _DynamicStructBu
     if not to_bytes:
         return array_msg
     else:
-        return array_msg.to_bytes_packed()
+        # packing only squeezes zero-runs, which dense ndarray payloads barely
+        # have, while costing a pass over the whole message
+        return array_msg.to_bytes()
 
 
 def capnp_deserialize(
@@ -77,11 +79,16 @@ def capnp_deserialize(
         array_struct: CapnpModule = schema.Array  # type: ignore
         # https://stackoverflow.com/questions/48458839/capnproto-maximum-filesize
         MAX_TRAVERSAL_LIMIT = 2**64 - 1
-        # to pack or not to pack?
-        # array_msg = array_struct.from_bytes(buf, traversal_limit_in_words=2 ** 64 - 1)
-        array_msg = array_struct.from_bytes_packed(
+        # capnp from_bytes is now a context
+        with array_struct.from_bytes(
             msg, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
-        )
+        ) as array_msg:
+            array_metadata = array_msg.arrayMetadata
+            return arrow_deserialize(
+                combine_bytes(array_msg.array),
+                decompressed_size=array_metadata.decompressedSize,
+                dtype=array_metadata.dtype,
+            )
     else:
         array_msg = msg
 
@@ -97,13 +104,17 @@ def capnp_deserialize(
 
 def arrow_serialize(
     obj: np.ndarray, get_bytes: bool = False
-) -> Union[Tuple[bytes, int], NumpyProto]:
+) -> Union[Tuple[Union[bytes, memoryview], int], NumpyProto]:
     original_dtype = obj.dtype
     apache_arrow = pa.Tensor.from_numpy(obj=obj)
     sink = pa.BufferOutputStream()
     pa.ipc.write_tensor(apache_arrow, sink)
     buffer = sink.getvalue()
     if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
+        if get_bytes:
+            # hand the arrow buffer straight to the capnp writer; to_pybytes
+            # would copy the whole tensor once more for nothing
+            return memoryview(buffer), buffer.size
         numpy_bytes = buffer.to_pybytes()
     else:
         numpy_bytes = pa.compress(
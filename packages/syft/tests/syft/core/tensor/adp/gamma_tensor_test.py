@@ -138,3 +138,31 @@ def test_gamma_publish(
     assert results < upper_bound.sum() + 10
     assert -10 + lower_bound.sum() < results
     print(ledger_store.kv_store)
+
+
+def test_setitem_invalidates_sum_cache() -> None:
+    """__setitem__ mutates the data subjects in place; a cached sum reduction
+    must not survive it and keep attributing the new data to the old subjects."""
+    alice = np.array([DataSubjectArray(["alice"]) for _ in range(4)])
+    bob = np.array([DataSubjectArray(["bob"]) for _ in range(2)])
+
+    tensor = PT(
+        child=np.array([1, 2, 3, 4]),
+        data_subjects=alice,
+        min_vals=np.zeros(4),
+        max_vals=np.ones(4) * 10,
+    ).gamma
+    other = PT(
+        child=np.array([5, 6]),
+        data_subjects=bob,
+        min_vals=np.zeros(2),
+        max_vals=np.ones(2) * 10,
+    ).gamma
+
+    before = tensor.sum()
+    assert before.data_subjects.item().data_subjects == {"alice"}
+
+    tensor[0:2] = other
+
+    after = tensor.sum()
+    assert "bob" in after.data_subjects.item().data_subjects
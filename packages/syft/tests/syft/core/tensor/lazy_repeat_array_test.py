@@ -4,7 +4,9 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.core.tensor.lazy_repeat_array import comparison_bounds
 from syft.core.tensor.lazy_repeat_array import lazyrepeatarray
+from syft.core.tensor.lazy_repeat_array import matmul_min_max
 
 
 def test_create_lazy_repeat_array() -> None:
@@ -94,3 +96,87 @@ def test_sum() -> None:
     lazyarray = lazyrepeatarray(data=np.array([1]), shape=array.shape)
 
     assert lazyarray.sum(axis=None).data == array.sum(axis=None)
+
+
+def test_matmul_min_max_negative_ranges() -> None:
+    # min @ min is not a lower bound once operands can be negative:
+    # [-1, 1] @ [-1, 1] reaches -1, while min @ min claims 1
+    a_min = lazyrepeatarray(data=np.array(-1.0), shape=(1, 1))
+    a_max = lazyrepeatarray(data=np.array(1.0), shape=(1, 1))
+    b_min = np.array([[-1.0]])
+    b_max = np.array([[1.0]])
+
+    lo, hi = matmul_min_max(a_min, a_max, b_min, b_max)
+
+    assert lo.data <= -1.0
+    assert hi.data >= 1.0
+
+
+def test_matmul_min_max_encloses_product() -> None:
+    rng = np.random.default_rng(42)
+    for _ in range(20):
+        m, k, n = rng.integers(1, 5, size=3)
+        a_min = rng.normal(size=(m, k))
+        a_max = a_min + rng.random((m, k))
+        b_min = rng.normal(size=(k, n))
+        b_max = b_min + rng.random((k, n))
+
+        lo, hi = matmul_min_max(
+            lazyrepeatarray(data=a_min, shape=(m, k)),
+            lazyrepeatarray(data=a_max, shape=(m, k)),
+            b_min,
+            b_max,
+        )
+
+        for _ in range(20):
+            a = a_min + rng.random((m, k)) * (a_max - a_min)
+            b = b_min + rng.random((k, n)) * (b_max - b_min)
+            product = a @ b
+            assert (product >= lo.to_numpy() - 1e-9).all()
+            assert (product <= hi.to_numpy() + 1e-9).all()
+
+
+def test_matmul_min_max_point_operand() -> None:
+    # a point right-hand side has zero radius, so the bounds are exact
+    a_min = np.array([[-2.0, 0.0], [1.0, -1.0]])
+    a_max = np.array([[1.0, 2.0], [3.0, 0.0]])
+    point = np.array([[1.0, -1.0], [-2.0, 2.0]])
+
+    lo, hi = matmul_min_max(
+        lazyrepeatarray(data=a_min, shape=(2, 2)),
+        lazyrepeatarray(data=a_max, shape=(2, 2)),
+        point,
+        point,
+    )
+
+    pos = np.maximum(point, 0)
+    neg = np.minimum(point, 0)
+    assert np.allclose(lo.to_numpy(), a_min @ pos + a_max @ neg)
+    assert np.allclose(hi.to_numpy(), a_max @ pos + a_min @ neg)
+
+
+def test_comparison_bounds() -> None:
+    min_vals, max_vals = comparison_bounds(
+        lazyrepeatarray(data=np.array([0.0]), shape=(2, 3)),
+        lazyrepeatarray(data=np.array([5.0]), shape=(2, 3)),
+    )
+
+    assert min_vals.shape == (2, 3)
+    assert max_vals.shape == (2, 3)
+    assert min_vals.dtype == np.int8
+    assert max_vals.dtype == np.int8
+    assert (min_vals.to_numpy() == 0).all()
+    assert (max_vals.to_numpy() == 1).all()
+
+
+def test_comparison_bounds_scalar_shape() -> None:
+    # comparisons on summed tensors carry a () shape, which the constant
+    # bounds must broadcast to
+    min_vals, max_vals = comparison_bounds(
+        lazyrepeatarray(data=np.array(0.0), shape=()),
+        lazyrepeatarray(data=np.array(5.0), shape=()),
+    )
+
+    assert min_vals.to_numpy().shape == ()
+    assert min_vals.to_numpy() == 0
+    assert max_vals.to_numpy() == 1